@@ -1,23 +1,117 @@
 import hashlib
+import hmac
 import os
-import uuid
+import sys
+import time
 import datetime
+import functools
+import mmap
+import multiprocessing
+import struct
+import tempfile
 
 # Data file paths
 USER_CREDENTIALS_FILE = "user_credentials.txt"
 TASK_DATA_DIR = "task_data"  # Directory to store task files
 
+# Binary task records: a "<BH" prefix holding the ID and description byte
+# lengths, the UTF-8 ID and description, then a "<BI" suffix holding the
+# status code and the date as a proleptic ordinal. The status byte of each
+# record can be rewritten in place.
+TASK_FILE_HEADER = b"#tasks binary v2\n"
+RECORD_PREFIX = struct.Struct("<BH")
+RECORD_SUFFIX = struct.Struct("<BI")
+MAX_ID_BYTES = 0xFF
+MAX_DESC_BYTES = 0xFFFF
+STATUS_NAMES = ("Pending", "Completed")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+# Erase the screen and move the cursor home
+CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+
+# Password hash algorithm; changing it invalidates every stored hash
+PASSWORD_HASH_ALGORITHM = "sha256"
+if PASSWORD_HASH_ALGORITHM not in hashlib.algorithms_available:
+    raise RuntimeError(f"hashlib has no {PASSWORD_HASH_ALGORITHM} implementation")
+# Resolve the constructor once (OpenSSL-backed where available)
+_hasher = getattr(hashlib, PASSWORD_HASH_ALGORITHM)
+PBKDF2_ITERATIONS = 300_000  # Keeps one derivation under ~100 ms
+SALT_SIZE = 16  # Bytes of random salt per user
+
+# Characters not allowed in usernames
+INVALID_USERNAME_CHARS = ":/\\"
+
+# Parsed credentials, reloaded only when the credentials file changes
+_cred_cache = {"stamp": None, "map": {}}
+
+# Lines of piped stdin, read in one batch on first use
+_input_state = {"lines": None}
+
+def enable_ansi_clear():
+    """Checks whether the console can be cleared with an ANSI escape.
+
+    On Windows this switches the console into virtual terminal mode once,
+    so the escape works there too.
+
+    Returns:
+        bool: True if clear_screen can write the escape sequence.
+    """
+    if not sys.stdout.isatty():
+        return False
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+_ansi_clear = enable_ansi_clear()
+
 def clear_screen():
     """Clears the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _ansi_clear:
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    elif os.name == 'nt' and sys.stdout.isatty():
+        os.system('cls')  # Older consoles without virtual terminal support
 
-def generate_unique_id():
-    """Generates a unique ID using uuid.
+def read_input(prompt):
+    """Reads one line of user input.
+
+    On an interactive terminal this is input(), so line editing still
+    works. When stdin is piped or redirected (scripted runs), all of it is
+    read in one call up front and handed out line by line.
+
+    Args:
+        prompt (str): The prompt to show.
 
     Returns:
-        str: A unique identifier.
+        str: The line entered, without the newline.
+
+    Raises:
+        EOFError: If piped input has run out, as input() would.
     """
-    return str(uuid.uuid4())
+    if sys.stdin.isatty():
+        return input(prompt)
+    if _input_state["lines"] is None:
+        # Split on "\n" only, as input() does; splitlines() would also break
+        # on characters such as \f or \u2028 inside a line
+        lines = sys.stdin.read().split("\n")
+        if not lines[-1]:
+            lines.pop()  # Nothing follows the final newline
+        _input_state["lines"] = (line.removesuffix("\r") for line in lines)
+    sys.stdout.write(prompt)
+    try:
+        return next(_input_state["lines"])
+    except StopIteration:
+        raise EOFError from None
 
 def get_valid_date():
     """
@@ -27,66 +121,321 @@ def get_valid_date():
         datetime.date: The date entered by the user.  Returns None on error.
     """
     while True:
-        date_str = input("Enter date (YYYY-MM-DD): ")
+        date_str = read_input("Enter date (YYYY-MM-DD): ")
         try:
-            return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+            # Only one format is accepted, so slice it instead of using strptime
+            digits = date_str[0:4] + date_str[5:7] + date_str[8:10]
+            if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-" or not digits.isdigit():
+                raise ValueError(date_str)
+            return datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
             return None
 
-def hash_password(password):
-    """Hashes the password using SHA-256.
+def hash_password(password, salt):
+    """Derives a salted PBKDF2-HMAC hash of the password.
 
     Args:
         password (str): The password to hash.
+        salt (bytes): The user's random salt.
+
+    Returns:
+        str: The hashed password as hex.
+    """
+    return hashlib.pbkdf2_hmac(PASSWORD_HASH_ALGORITHM, password.encode("utf-8"), salt, PBKDF2_ITERATIONS).hex()
+
+@functools.lru_cache(maxsize=64)
+def verify_password(password, stored_record):
+    """Checks a password against a stored credential record.
+
+    Records are "salt_hex:hash_hex" (PBKDF2); records written before salting
+    was introduced hold a bare unsalted hash and are still accepted. Results
+    are cached for the session, so logging in again with the same password
+    skips the key derivation.
+
+    Args:
+        password (str): The password entered by the user.
+        stored_record (str): Everything after "username:" in the credentials file.
 
     Returns:
-        str: The hashed password.
+        bool: True if the password matches.
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    if ":" in stored_record:
+        salt_hex, stored_hash = stored_record.split(":", 1)
+        candidate = hash_password(password, bytes.fromhex(salt_hex))
+    else:
+        stored_hash = stored_record
+        candidate = _hasher(password.encode("utf-8")).hexdigest()
+    return hmac.compare_digest(candidate, stored_hash)
+
+def parse_task_line(line):
+    """Splits a stored task line into its four fields.
+
+    The task ID and the trailing status/date never contain a colon, so the
+    description is whatever lies between them (and may contain colons).
+
+    Args:
+        line (str): A line from a task file, without the trailing newline.
+
+    Returns:
+        list: [task_id, description, status, date_str]
+
+    Raises:
+        ValueError: If the line does not hold all four fields.
+    """
+    fields = line.split(":", 1)
+    if len(fields) == 2:
+        fields[1:] = fields[1].rsplit(":", 2)
+    if len(fields) != 4:
+        raise ValueError(f"Malformed task line: {line!r}")
+    return fields
+
+def parse_text_tasks(mm):
+    """Parses a task file in the original colon-separated line format.
+
+    Returns:
+        tuple: (rows, skipped_lines) where skipped_lines holds the lines
+        that could not be parsed, unchanged.
+    """
+    rows = []
+    skipped_lines = []
+    pos = 0
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = size
+        line = mm[pos:end].decode("utf-8").rstrip("\r")
+        if line:
+            try:
+                rows.append(parse_task_line(line))
+            except ValueError:
+                skipped_lines.append(line)
+        pos = end + 1
+    return rows, skipped_lines
+
+def parse_binary_tasks(mm, path):
+    """Parses a task file in the binary record format.
+
+    Returns:
+        tuple: (rows, status_offsets) where status_offsets[i] is the file
+        offset of row i's status byte.
+    """
+    rows = []
+    status_offsets = []
+    pos = len(TASK_FILE_HEADER)
+    size = len(mm)
+    try:
+        while pos < size:
+            id_len, desc_len = RECORD_PREFIX.unpack_from(mm, pos)
+            pos += RECORD_PREFIX.size
+            task_id = mm[pos:pos + id_len].decode("utf-8")
+            pos += id_len
+            description = mm[pos:pos + desc_len].decode("utf-8")
+            pos += desc_len
+            status_code, ordinal = RECORD_SUFFIX.unpack_from(mm, pos)
+            status_offsets.append(pos)
+            pos += RECORD_SUFFIX.size
+            rows.append([task_id, description, STATUS_NAMES[status_code],
+                         datetime.date.fromordinal(ordinal).isoformat()])
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"{path} has a truncated or corrupt task record") from e
+    return rows, status_offsets
+
+def read_task_file(path):
+    """Reads every task from a task file.
+
+    Files starting with TASK_FILE_HEADER hold binary records; older files
+    are colon-separated lines.
+
+    Args:
+        path (str): Path of the task file.
+
+    Returns:
+        tuple: (rows, status_offsets, skipped_lines) where rows is a list
+        of [task_id, description, status, date_str]. status_offsets lists
+        the file offset of each row's status byte, or is None when the file
+        is in an older format and must be rewritten before updating in
+        place. skipped_lines holds old-format lines that could not be parsed.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], None, []  # mmap cannot map an empty file
+        # Map the file instead of read() so no copy of the whole file is made
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(TASK_FILE_HEADER)] == TASK_FILE_HEADER:
+                return (*parse_binary_tasks(mm, path), [])
+            rows, skipped_lines = parse_text_tasks(mm)
+            return rows, None, skipped_lines
+
+def format_task_record(task_id, description, status, date_str):
+    """Builds one binary task record.
+
+    Raises:
+        ValueError: If the ID or description is too long, or the status or
+        date cannot be stored.
+
+    Returns:
+        bytes: The encoded record.
+    """
+    id_bytes = task_id.encode("utf-8")
+    desc_bytes = description.encode("utf-8")
+    if len(id_bytes) > MAX_ID_BYTES or len(desc_bytes) > MAX_DESC_BYTES:
+        raise ValueError(f"Task {task_id!r} is too long to store")
+    if status not in STATUS_CODES:
+        raise ValueError(f"Unknown task status: {status!r}")
+    ordinal = datetime.date.fromisoformat(date_str).toordinal()
+    return b"".join((
+        RECORD_PREFIX.pack(len(id_bytes), len(desc_bytes)),
+        id_bytes,
+        desc_bytes,
+        RECORD_SUFFIX.pack(STATUS_CODES[status], ordinal),
+    ))
+
+def split_storable_rows(rows):
+    """Separates old-format rows the binary format can hold from the rest.
+
+    Old colon-separated files may contain invalid dates or statuses.
+
+    Args:
+        rows (list): [task_id, description, status, date_str] rows.
+
+    Returns:
+        tuple: (valid_rows, invalid_lines) where invalid_lines are the
+        rejected rows joined back into their original text lines.
+    """
+    valid_rows = []
+    invalid_lines = []
+    for row in rows:
+        try:
+            format_task_record(*row)
+        except ValueError:
+            invalid_lines.append(":".join(row))
+        else:
+            valid_rows.append(row)
+    return valid_rows, invalid_lines
+
+def replace_file(path, data):
+    """Replaces a file's contents without ever leaving it half-written.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over the original, so a crash or full disk keeps the old file.
+
+    Args:
+        path (str): The file to replace.
+        data (bytes): The new contents.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def load_credentials():
+    """Returns the stored credentials as a {username: stored_record} dict.
+
+    The file is parsed again only when its modification time or size
+    changes (the size catches appends within the same mtime tick).
+
+    Raises:
+        FileNotFoundError: If no user has been registered yet.
+    """
+    st = os.stat(USER_CREDENTIALS_FILE)
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp != _cred_cache["stamp"]:
+        with open(USER_CREDENTIALS_FILE, "r") as f:
+            lines = f.read().splitlines()
+        credentials = {}
+        for line in lines:
+            if ":" not in line:
+                continue  # Malformed line
+            username, stored_record = line.split(":", 1)
+            # The first entry for a username wins, as in a top-down scan
+            credentials.setdefault(username, stored_record)
+        _cred_cache["map"] = credentials
+        _cred_cache["stamp"] = stamp
+    return _cred_cache["map"]
 
 def register_user():
     """Registers a new user by prompting for username and password,
     ensuring username uniqueness, and storing the hashed password.
     """
+    # Registered usernames, loaded once so retries need no file access
+    try:
+        known_users = load_credentials()
+    except FileNotFoundError:
+        known_users = {}
     while True:
-        username = input("Enter username: ")
-        if os.path.exists(os.path.join(TASK_DATA_DIR, f"{username}.txt")):
-            print("Username already exists. Please choose a different one.")
-            continue  # Go back to the beginning of the while loop
+        username = read_input("Enter username: ")
         if not username:
             print("Username cannot be empty. Please enter a valid username")
             continue
-        password = input("Enter password: ")
+        # ":" separates stored fields and the name becomes a file name
+        if any(ch in username for ch in INVALID_USERNAME_CHARS):
+            print("Username cannot contain ':', '/' or '\\'. Please enter a valid username")
+            continue
+        if username in known_users:
+            print("Username already exists. Please choose a different one.")
+            continue  # Go back to the beginning of the while loop
+        password = read_input("Enter password: ")
         if not password:
             print("Password cannot be empty. Please enter a valid password")
             continue
-        hashed_password = hash_password(password)
+        salt = os.urandom(SALT_SIZE)
+        hashed_password = hash_password(password, salt)
         try:
             with open(USER_CREDENTIALS_FILE, "a") as f:
-                f.write(f"{username}:{hashed_password}\n")
+                f.write(f"{username}:{salt.hex()}:{hashed_password}\n")
             print("User registered successfully.")
             return username  # Return the username upon successful registration
         except Exception as e:
             print(f"Error registering user: {e}")
             return None # Return None on error
 
+def upgrade_password_hash(username, password):
+    """Replaces a user's unsalted legacy hash with a salted PBKDF2 record.
+
+    Args:
+        username (str): The user who just logged in.
+        password (str): The password they logged in with.
+    """
+    salt = os.urandom(SALT_SIZE)
+    record = f"{username}:{salt.hex()}:{hash_password(password, salt)}"
+    with open(USER_CREDENTIALS_FILE, "r") as f:
+        lines = f.read().splitlines()
+        encoding = f.encoding
+    for i, line in enumerate(lines):
+        if line.split(":", 1)[0] == username:
+            lines[i] = record  # Only the first entry is used at login
+            break
+    replace_file(USER_CREDENTIALS_FILE, "".join(f"{line}\n" for line in lines).encode(encoding))
+
 def login_user():
     """Logs in an existing user by prompting for username and password,
     validating the credentials, and returning the username upon success.
     """
-    username = input("Enter username: ")
-    password = input("Enter password: ")
-    hashed_password = hash_password(password)
+    username = read_input("Enter username: ")
+    password = read_input("Enter password: ")
     try:
-        with open(USER_CREDENTIALS_FILE, "r") as f:
-            for line in f:
-                stored_username, stored_hashed_password = line.strip().split(":")
-                if username == stored_username and hashed_password == stored_hashed_password:
-                    print("Logged in successfully.")
-                    return username
+        stored_record = load_credentials().get(username)
+        if stored_record is not None and verify_password(password, stored_record):
+            if ":" not in stored_record:
+                try:
+                    upgrade_password_hash(username, password)
+                except OSError as e:
+                    print(f"Could not upgrade stored password: {e}")
+            print("Logged in successfully.")
+            return username
         print("Invalid credentials. Please try again.")
         return None
     except FileNotFoundError:
@@ -96,121 +445,258 @@ def login_user():
         print(f"Error logging in: {e}")
         return None
 
-def add_task(username):
-    """Adds a new task for the given user.
+class TaskStore:
+    """Holds the logged-in user's tasks in memory for the whole session.
+
+    Tasks are kept as four parallel column lists (ids, descs, statuses,
+    dates) with an index mapping each task ID to its row, so the task file
+    is read once at login and written once at logout instead of on every
+    operation. As long as no task was deleted, the saved rows are still on
+    disk at their recorded offsets: the flush then rewrites only the status
+    byte of completed tasks and appends the new records.
+
+    Files in the old colon-separated format are left alone unless the
+    session changes something. They are then converted to the binary
+    format, or rewritten as text if some of their lines (kept verbatim in
+    kept_lines) cannot be converted, so no line is ever dropped.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.ids = []
+        self.descs = []
+        self.statuses = []
+        self.dates = []
+        self.index = {}
+        self.saved_rows = 0  # Rows already on disk, in the same order
+        self.status_offsets = []  # File offset of each saved row's status byte
+        self.changed_rows = set()  # Saved rows whose status has changed
+        self.text_file = False  # File on disk is in the old text format
+        self.kept_lines = []  # Old-format lines that cannot be loaded
+        self._id_counter = 0
+        self.dirty = False  # True when the file must be rewritten in full
+
+    def load(self, username):
+        """Reads the user's task file into memory.
+
+        Args:
+            username (str): The username of the logged-in user.
+        """
+        self.path = os.path.join(TASK_DATA_DIR, f"{username}.txt")
+        try:
+            rows, status_offsets, skipped_lines = read_task_file(self.path)
+        except FileNotFoundError:
+            rows, status_offsets, skipped_lines = [], None, []
+        self.text_file = bool(rows or skipped_lines) and status_offsets is None
+        self.kept_lines = skipped_lines
+        if self.text_file:
+            rows, invalid_lines = split_storable_rows(rows)
+            self.kept_lines += invalid_lines
+        # Transpose rows into columns with zip() rather than a per-row loop
+        columns = [list(column) for column in zip(*rows)] or [[], [], [], []]
+        self.ids, self.descs, self.statuses, self.dates = columns
+        self.index = dict(zip(self.ids, range(len(self.ids))))
+        self.saved_rows = len(self.ids)
+        self.status_offsets = status_offsets or []
+        self.changed_rows = set()
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.ids)
+
+    def rows(self):
+        """Returns an iterator of (task_id, description, status, date_str)."""
+        return zip(self.ids, self.descs, self.statuses, self.dates)
+
+    def generate_unique_id(self):
+        """Generates a task ID unique within this user's tasks.
+
+        IDs are the current time in milliseconds followed by a per-session
+        counter, both in hex, which is much cheaper than a random UUID.
+
+        Returns:
+            str: A unique identifier.
+        """
+        while True:
+            task_id = f"{int(time.time() * 1000):x}{self._id_counter:04x}"
+            self._id_counter = (self._id_counter + 1) & 0xFFFF
+            if task_id not in self.index:
+                return task_id
+
+    def add(self, task_id, description, status, date_str):
+        """Appends a new task."""
+        self.index[task_id] = len(self.ids)
+        self.ids.append(task_id)
+        self.descs.append(description)
+        self.statuses.append(status)
+        self.dates.append(date_str)
+
+    def mark_complete(self, task_id):
+        """Sets the status of an existing task to "Completed"."""
+        row = self.index[task_id]
+        self.statuses[row] = "Completed"
+        if row < self.saved_rows:
+            self.changed_rows.add(row)
+
+    def delete(self, task_id):
+        """Removes a task by moving the last row into its slot."""
+        row = self.index.pop(task_id)
+        last = len(self.ids) - 1
+        for column in (self.ids, self.descs, self.statuses, self.dates):
+            column[row] = column[last]
+            column.pop()
+        if row != last:
+            self.index[self.ids[row]] = row
+        self.dirty = True
+
+    def flush(self):
+        """Writes the tasks back to the user's file if anything changed."""
+        new_rows = range(self.saved_rows, len(self.ids))
+        if not (self.dirty or self.changed_rows or new_rows):
+            return
+        if self.text_file and self.kept_lines:
+            lines = [":".join(row) for row in self.rows()] + self.kept_lines
+            replace_file(self.path, "".join(f"{line}\n" for line in lines).encode("utf-8"))
+            records = []
+        elif self.dirty or self.text_file or self.saved_rows == 0:
+            records = [format_task_record(*row) for row in self.rows()]
+            replace_file(self.path, b"".join([TASK_FILE_HEADER, *records]))
+            self.status_offsets = []
+            self.text_file = False
+            pos = len(TASK_FILE_HEADER)
+        else:
+            records = [format_task_record(*row) for row in zip(
+                self.ids[self.saved_rows:], self.descs[self.saved_rows:],
+                self.statuses[self.saved_rows:], self.dates[self.saved_rows:])]
+            with open(self.path, "r+b") as f:
+                for row in sorted(self.changed_rows):
+                    f.seek(self.status_offsets[row])
+                    f.write(bytes((STATUS_CODES[self.statuses[row]],)))
+                pos = f.seek(0, os.SEEK_END)
+                f.write(b"".join(records))
+        for record in records:
+            pos += len(record)
+            self.status_offsets.append(pos - RECORD_SUFFIX.size)
+        self.saved_rows = len(self.ids)
+        self.changed_rows = set()
+        self.dirty = False
+
+def add_task(store):
+    """Adds a new task for the logged-in user.
 
     Args:
-        username (str): The username of the logged-in user.
+        store (TaskStore): The logged-in user's tasks.
     """
-    task_description = input("Enter task description: ")
+    task_description = read_input("Enter task description: ")
     if not task_description:
         print("Task description cannot be empty. Task not added.")
         return
+    if len(task_description.encode("utf-8")) > MAX_DESC_BYTES:
+        print("Task description is too long. Task not added.")
+        return
 
-    task_id = generate_unique_id()
+    task_id = store.generate_unique_id()
     date = get_valid_date()
     if date is None:
         print("Failed to add task: Invalid date.")
         return
-    status = "Pending"
-    task = {"task_id": task_id, "description": task_description, "status": status, "date": date.isoformat()}
-    try:
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "a") as f:
-            f.write(f"{task_id}:{task_description}:{status}:{date.isoformat()}\n")
-        print("Task added successfully.")
-    except Exception as e:
-        print(f"Error adding task: {e}")
+    store.add(task_id, task_description, "Pending", date.isoformat())
+    print("Task added successfully.")
 
-def view_tasks(username):
-    """Displays all tasks for the given user.
+def view_tasks(store):
+    """Displays all tasks for the logged-in user.
 
     Args:
-        username (str): The username of the logged-in user.
+        store (TaskStore): The logged-in user's tasks.
     """
-    try:
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "r") as f:
-            tasks = f.readlines()
-        if not tasks:
-            print("No tasks found.")
-            return
-        print("\n--- Your Tasks ---")
-        for task in tasks:
-            task_id, description, status, date_str = task.strip().split(":")
-            try:
-                display_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                print(f"Task ID: {task_id}, Description: {description}, Status: {status}, Date: {display_date}")
-            except ValueError:
-                print(f"Skipping task with invalid date: {task}")
-
-    except FileNotFoundError:
+    if not store and not store.kept_lines:
         print("No tasks found.")
-    except Exception as e:
-        print(f"Error viewing tasks: {e}")
+        return
+    # Collect the output and write it at once rather than one print per task
+    lines = ["\n--- Your Tasks ---"]
+    # Every loaded or added date is a valid ISO date, so print it as stored
+    for task_id, description, status, date_str in store.rows():
+        lines.append(f"Task ID: {task_id}, Description: {description}, Status: {status}, Date: {date_str}")
+    lines += [f"Skipping task with invalid data: {line}" for line in store.kept_lines]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def update_task_status(username):
-    """Updates the status of a task to "Completed" for the given user.
+def update_task_status(store):
+    """Updates the status of a task to "Completed" for the logged-in user.
 
     Args:
-        username (str): The username of the logged-in user.
+        store (TaskStore): The logged-in user's tasks.
     """
-    task_id = input("Enter the ID of the task to mark as completed: ")
-    updated_tasks = []
-    task_found = False
-    try:
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "r") as f:
-            tasks = f.readlines()
-        for task in tasks:
-            stored_task_id, description, status, date_str = task.strip().split(":")
-            if stored_task_id == task_id:
-                if status == "Completed":
-                    print("Task already marked as completed.")
-                    updated_tasks.append(task)  # Keep the original task data
-                else:
-                    status = "Completed"
-                    updated_tasks.append(f"{stored_task_id}:{description}:{status}:{date_str}\n")
-                    print("Task status updated successfully.")
-                task_found = True
-            else:
-                updated_tasks.append(task)
-        if not task_found:
-            print("Task not found.")
+    task_id = read_input("Enter the ID of the task to mark as completed: ")
+    row = store.index.get(task_id)
+    if row is None:
+        print("Task not found.")
+    elif store.statuses[row] == "Completed":
+        print("Task already marked as completed.")
+    else:
+        store.mark_complete(task_id)
+        print("Task status updated successfully.")
+
+def delete_task(store):
+    """Deletes a task for the logged-in user.
 
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "w") as f:
-            f.writelines(updated_tasks)
+    Args:
+        store (TaskStore): The logged-in user's tasks.
+    """
+    task_id = read_input("Enter the ID of the task to delete: ")
+    if task_id not in store.index:
+        print("Task not found.")
+        return
+    store.delete(task_id)
+    print("Task deleted successfully.")
 
-    except FileNotFoundError:
-        print("No tasks found.")
-    except Exception as e:
-        print(f"Error updating task status: {e}")
+# Task menu choices, dispatched with one dict lookup instead of an elif chain
+MENU_ACTIONS = {
+    'a': add_task,
+    'b': view_tasks,
+    'c': update_task_status,
+    'd': delete_task,
+}
 
-def delete_task(username):
-    """Deletes a task for the given user.
+def _parse_user_file(path):
+    """Reads one user's task file for report(); runs in a worker process.
 
-    Args:
-        username (str): The username of the logged-in user.
+    Returns:
+        tuple: (tasks, skipped) where tasks is a list of four-field
+        (task_id, description, status, date_str) tuples and skipped counts
+        lines that could not be parsed, or None if the file could not be read.
     """
-    task_id = input("Enter the ID of the task to delete: ")
-    updated_tasks = []
-    task_found = False
     try:
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "r") as f:
-            tasks = f.readlines()
-        for task in tasks:
-            stored_task_id, description, status, date_str = task.strip().split(":")
-            if stored_task_id == task_id:
-                print("Task deleted successfully.")
-                task_found = True
-            else:
-                updated_tasks.append(task)
-        if not task_found:
-            print("Task not found.")
-        with open(os.path.join(TASK_DATA_DIR, f"{username}.txt"), "w") as f:
-            f.writelines(updated_tasks)
+        rows, _, skipped_lines = read_task_file(path)
+    except (OSError, ValueError):
+        return None
+    return [tuple(row) for row in rows], len(skipped_lines)
 
+def report():
+    """Prints a task summary for every user, parsing the files in parallel."""
+    # scandir yields names and cached file types in one directory pass
+    try:
+        with os.scandir(TASK_DATA_DIR) as it:
+            entries = [e for e in it if e.name.endswith(".txt") and e.is_file()]
     except FileNotFoundError:
-        print("No tasks found.")
-    except Exception as e:
-        print(f"Error deleting task: {e}")
+        entries = []
+    entries.sort(key=lambda e: e.name)
+    if not entries:
+        print("No task files found.")
+        return
+    with multiprocessing.Pool(min(len(entries), os.cpu_count() or 1)) as pool:
+        all_tasks = pool.map(_parse_user_file, [entry.path for entry in entries])
+    print("\n--- Task Report ---")
+    for entry, result in zip(entries, all_tasks):
+        username = entry.name[:-len(".txt")]
+        if result is None:
+            print(f"User: {username}, Skipping unreadable task file.")
+            continue
+        tasks, skipped = result
+        completed = sum(1 for _, _, status, _ in tasks if status == "Completed")
+        summary = f"User: {username}, Tasks: {len(tasks)}, Pending: {len(tasks) - completed}, Completed: {completed}"
+        if skipped:
+            summary += f", Invalid lines skipped: {skipped}"
+        print(summary)
 
 def display_menu(username):
     """Displays the main menu options to the user.
@@ -229,8 +715,7 @@ def display_menu(username):
 def main():
     """Main function to run the task manager application."""
     # Create the directory for task data if it doesn't exist
-    if not os.path.exists(TASK_DATA_DIR):
-        os.makedirs(TASK_DATA_DIR)
+    os.makedirs(TASK_DATA_DIR, exist_ok=True)
 
     clear_screen()
     print("Welcome to the Task Manager!")
@@ -240,7 +725,7 @@ def main():
         print("1. Register")
         print("2. Login")
         print("3. Exit")
-        choice = input("Enter your choice: ")
+        choice = read_input("Enter your choice: ")
 
         if choice == '1':
             username = register_user()
@@ -256,26 +741,41 @@ def main():
         else:
             print("Invalid choice. Please try again.")
 
+    # Load the user's tasks once; they are written back on logout
+    store = TaskStore()
+    try:
+        store.load(username)
+    except Exception as e:
+        print(f"Error loading tasks: {e}")
+        return
+
     # Main task management loop
-    while True:
-        clear_screen()
-        display_menu(username)
-        choice = input("Enter your choice: ")
-
-        if choice == 'a':
-            add_task(username)
-        elif choice == 'b':
-            view_tasks(username)
-        elif choice == 'c':
-            update_task_status(username)
-        elif choice == 'd':
-            delete_task(username)
-        elif choice == 'e':
-            print("Logging out...")
-            break
-        else:
-            print("Invalid choice. Please try again.")
-        input("Press Enter to continue...")
+    try:
+        while True:
+            clear_screen()
+            display_menu(username)
+            choice = read_input("Enter your choice: ")
+
+            if choice == 'e':
+                print("Logging out...")
+                break
+            action = MENU_ACTIONS.get(choice)
+            if action:
+                action(store)
+            else:
+                print("Invalid choice. Please try again.")
+            read_input("Press Enter to continue...")
+    finally:
+        try:
+            store.flush()
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["report"]:
+        report()  # Summary of every user's tasks, for administrators
+    else:
+        try:
+            main()
+        except EOFError:
+            print("\nEnd of input. Exiting...")  # Scripted input ran out
@@ -0,0 +1,143 @@
+"""Round-trip checks for the task file formats and TaskStore.
+
+Run from any directory with:
+    python TaskManagementProject/test_task_store.py
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import ConsolidatedTaskManagerWithUserAuthentication as tm
+
+
+class TaskStoreRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        # The app uses paths relative to the working directory
+        self.old_cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.makedirs(tm.TASK_DATA_DIR)
+        self.path = os.path.join(tm.TASK_DATA_DIR, "alice.txt")
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp.cleanup()
+
+    def write_text(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def read_bytes(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def load(self):
+        store = tm.TaskStore()
+        store.load("alice")
+        return store
+
+    def test_parse_task_line_keeps_colons_in_description(self):
+        self.assertEqual(tm.parse_task_line("id:a: b:Pending:2025-01-01"),
+                         ["id", "a: b", "Pending", "2025-01-01"])
+
+    def test_parse_task_line_rejects_short_lines(self):
+        for line in ("b2:just two", "no colon", "a:b:c"):
+            with self.assertRaises(ValueError):
+                tm.parse_task_line(line)
+
+    def test_unchanged_legacy_file_is_left_alone(self):
+        legacy = "a1:ok:Pending:2025-01-01\na2:old note:Pending:15/05/2025\nb2:just two\n"
+        self.write_text(legacy)
+        store = self.load()
+        self.assertEqual(list(store.rows()), [("a1", "ok", "Pending", "2025-01-01")])
+        self.assertEqual(store.kept_lines, ["b2:just two", "a2:old note:Pending:15/05/2025"])
+        store.flush()
+        self.assertEqual(self.read_bytes(), legacy.encode("utf-8"))
+
+    def test_legacy_file_with_bad_lines_keeps_them_on_save(self):
+        self.write_text("a1:ok:Pending:2025-01-01\na2:old note:Pending:15/05/2025\n")
+        store = self.load()
+        store.mark_complete("a1")
+        store.add("n1", "new: one", "Pending", "2025-02-02")
+        store.flush()
+        store = self.load()
+        self.assertEqual(list(store.rows()), [
+            ("a1", "ok", "Completed", "2025-01-01"),
+            ("n1", "new: one", "Pending", "2025-02-02"),
+        ])
+        self.assertEqual(store.kept_lines, ["a2:old note:Pending:15/05/2025"])
+
+    def test_clean_legacy_file_is_converted_on_change(self):
+        self.write_text("a1:ok:Pending:2025-01-01\n")
+        store = self.load()
+        store.mark_complete("a1")
+        store.flush()
+        self.assertTrue(self.read_bytes().startswith(tm.TASK_FILE_HEADER))
+        store = self.load()
+        self.assertFalse(store.text_file)
+        self.assertEqual(list(store.rows()), [("a1", "ok", "Completed", "2025-01-01")])
+
+    def test_add_complete_delete_across_sessions(self):
+        store = self.load()
+        store.add("t1", "first", "Pending", "2025-01-01")
+        store.add("t2", "second: é", "Pending", "1900-12-31")
+        store.add("t3", "third", "Pending", "2025-03-03")
+        store.flush()
+
+        store = self.load()
+        size = len(self.read_bytes())
+        store.mark_complete("t2")
+        store.flush()
+        # Completing a saved task rewrites its status byte in place
+        self.assertEqual(len(self.read_bytes()), size)
+
+        store = self.load()
+        self.assertEqual(store.statuses[store.index["t2"]], "Completed")
+        store.add("t4", "fourth", "Pending", "2025-04-04")
+        store.mark_complete("t4")
+        store.flush()
+
+        store = self.load()
+        store.delete("t1")
+        store.flush()
+
+        store = self.load()
+        self.assertEqual(sorted(store.rows()), [
+            ("t2", "second: é", "Completed", "1900-12-31"),
+            ("t3", "third", "Pending", "2025-03-03"),
+            ("t4", "fourth", "Completed", "2025-04-04"),
+        ])
+
+    def test_truncated_binary_file_is_rejected(self):
+        store = self.load()
+        store.add("t1", "first", "Pending", "2025-01-01")
+        store.flush()
+        data = self.read_bytes()
+        with open(self.path, "wb") as f:
+            f.write(data[:-2])
+        with self.assertRaises(ValueError):
+            tm.read_task_file(self.path)
+
+    def test_failed_rewrite_keeps_original_file(self):
+        self.write_text("a1:ok:Pending:2025-01-01\n")
+        store = self.load()
+        store.delete("a1")
+        real_fsync = os.fsync
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+
+        os.fsync = failing_fsync
+        try:
+            with self.assertRaises(OSError):
+                store.flush()
+        finally:
+            os.fsync = real_fsync
+        self.assertEqual(self.read_bytes(), b"a1:ok:Pending:2025-01-01\n")
+        self.assertEqual(os.listdir(tm.TASK_DATA_DIR), ["alice.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()